@@ -19,7 +19,7 @@ CREDITS: Sequence[tuple[str, str]] = (
     ("Universidad", "Universidad Nacional Abierta y a Distancia (UNAD)"),
     ("Curso", "Fundamentos de Programación - Código 213022"),
     ("Música procedimental", "Generador chiptune integrado (procedural)"),
-    ("Herramientas adicionales", "Python 3.11+, Tkinter, pygame"),
+    ("Herramientas adicionales", "Python 3.11+, Tkinter, pygame, NumPy"),
 )
 
 
@@ -80,6 +80,11 @@ class GameController:
                 if race and race.alignment is alignment:
                     self._armies[alignment].set_units(race, count)
 
+    def music_ready(self) -> bool:
+        """Return ``False`` only while the player is still preparing its track."""
+
+        return not self.music_player or self.music_player.is_ready
+
     def play_music(self) -> bool:
         if not self.music_player:
             return False
@@ -93,7 +98,7 @@ class GameController:
 
     def reset_armies(self) -> None:
         for army in self._armies.values():
-            army.roster.clear()
+            army.clear()
         self._persist_armies()
 
     def credits(self) -> tuple[str, ...]:
@@ -15,6 +15,21 @@ class Army:
 
     alignment: Alignment
     roster: Dict[Race, int] = field(default_factory=dict)
+    _total_units: int = field(init=False, default=0, repr=False, compare=False)
+    _total_power: int = field(init=False, default=0, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Apply the same rules as set_units so the cached totals match the roster.
+        for race, count in list(self.roster.items()):
+            if race.alignment is not self.alignment:
+                raise ValueError("Race alignment does not match the army alignment")
+            sanitized = max(0, int(count))
+            if sanitized:
+                self.roster[race] = sanitized
+            else:
+                del self.roster[race]
+        self._total_units = sum(self.roster.values())
+        self._total_power = sum(race.compute_power(count) for race, count in self.roster.items())
 
     def set_units(self, race: Race, count: int) -> None:
         """Set the number of units for ``race`` ensuring non-negative counts."""
@@ -22,16 +37,26 @@ class Army:
         if race.alignment is not self.alignment:
             raise ValueError("Race alignment does not match the army alignment")
         sanitized = max(0, int(count))
+        previous = self.roster.get(race, 0)
         if sanitized:
             self.roster[race] = sanitized
         else:
             self.roster.pop(race, None)
+        self._total_units += sanitized - previous
+        self._total_power += race.compute_power(sanitized) - race.compute_power(previous)
+
+    def clear(self) -> None:
+        """Remove every unit from the army."""
+
+        self.roster.clear()
+        self._total_units = 0
+        self._total_power = 0
 
     def total_units(self) -> int:
-        return sum(self.roster.values())
+        return self._total_units
 
     def total_power(self) -> int:
-        return sum(race.compute_power(count) for race, count in self.roster.items())
+        return self._total_power
 
     def snapshot(self) -> dict[str, int]:
         """Return a serialisable view of the roster keyed by race name."""
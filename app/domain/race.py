@@ -9,7 +9,7 @@ from typing import Final
 from .alignment import Alignment
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Race(ABC):
     """Base abstraction for any race that can fight in Centaurus."""
 
@@ -18,6 +18,11 @@ class Race(ABC):
     battle_value: int
     pixel_color: str
 
+    def __hash__(self) -> int:
+        # Races are dict keys in every roster; the name alone identifies them
+        # and ``str`` caches its own hash.
+        return hash(self.name)
+
     def compute_power(self, troops: int) -> int:
         """Return the total power contributed by ``troops`` units of this race."""
 
@@ -27,6 +32,8 @@ class Race(ABC):
 class BenevolentRace(Race):
     """Marker class for benevolent races."""
 
+    __slots__ = ()
+
     def __init__(self, name: str, battle_value: int, pixel_color: str) -> None:
         super().__init__(name=name, alignment=Alignment.BENEVOLENT, battle_value=battle_value, pixel_color=pixel_color)
 
@@ -34,56 +41,78 @@ class BenevolentRace(Race):
 class MalevolentRace(Race):
     """Marker class for malevolent races."""
 
+    __slots__ = ()
+
     def __init__(self, name: str, battle_value: int, pixel_color: str) -> None:
         super().__init__(name=name, alignment=Alignment.MALEVOLENT, battle_value=battle_value, pixel_color=pixel_color)
 
 
 class Osito(BenevolentRace):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__("Osito", 1, "#f7c8d0")
 
 
 class Principe(BenevolentRace):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__("Príncipe", 2, "#95c0ff")
 
 
 class Enano(BenevolentRace):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__("Enano", 3, "#fbe29f")
 
 
 class Cari(BenevolentRace):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__("Cari", 4, "#e87956")
 
 
 class Fulo(BenevolentRace):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__("Fulo", 5, "#8870ff")
 
 
 class Lolo(MalevolentRace):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__("Lolo", 2, "#ff6f91")
 
 
 class Fulano(MalevolentRace):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__("Fulano", 2, "#ff9671")
 
 
 class Hoggin(MalevolentRace):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__("Hoggin", 2, "#ffc75f")
 
 
 class Lurco(MalevolentRace):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__("Lurco", 3, "#a17fe0")
 
 
 class Trolli(MalevolentRace):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__("Trolli", 5, "#5c5470")
 
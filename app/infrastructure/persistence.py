@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import json
+import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
 from app.domain.alignment import Alignment
 
@@ -25,9 +26,14 @@ class ArmyStorage(ABC):
 
 @dataclass
 class JsonArmyStorage(ArmyStorage):
-    """Simple JSON-based storage mechanism."""
+    """Simple JSON-based storage mechanism.
+
+    The file is read once and kept in memory; every save rewrites it
+    atomically through a temporary sibling file.
+    """
 
     filepath: Path = field(default_factory=lambda: Path("data/armies.json"))
+    _cache: Optional[Dict[str, Dict[str, int]]] = field(init=False, default=None, repr=False, compare=False)
 
     def save(self, alignment: Alignment, roster: Dict[str, int]) -> None:
         data = self._read_all()
@@ -40,6 +46,11 @@ class JsonArmyStorage(ArmyStorage):
         return {name: int(count) for name, count in saved.items() if count > 0}
 
     def _read_all(self) -> Dict[str, Dict[str, int]]:
+        if self._cache is None:
+            self._cache = self._read_file()
+        return self._cache
+
+    def _read_file(self) -> Dict[str, Dict[str, int]]:
         if not self.filepath.exists():
             return {}
         try:
@@ -49,4 +60,6 @@ class JsonArmyStorage(ArmyStorage):
 
     def _write_all(self, data: Dict[str, Dict[str, int]]) -> None:
         self.filepath.parent.mkdir(parents=True, exist_ok=True)
-        self.filepath.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        partial = self.filepath.with_name(f"{self.filepath.name}.tmp")
+        partial.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        os.replace(partial, self.filepath)
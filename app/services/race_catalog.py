@@ -14,23 +14,29 @@ class RaceCatalog:
     """Provides read-only access to the registered races."""
 
     _by_alignment: Mapping[Alignment, tuple[Race, ...]] = field(init=False)
+    _names_by_alignment: Mapping[Alignment, tuple[str, ...]] = field(init=False)
+    _by_name: Mapping[str, Race] = field(init=False)
 
     def __post_init__(self) -> None:
         self._by_alignment = {
             Alignment.BENEVOLENT: BENEVOLENT_RACES,
             Alignment.MALEVOLENT: MALEVOLENT_RACES,
         }
+        self._names_by_alignment = {
+            alignment: tuple(race.name for race in races)
+            for alignment, races in self._by_alignment.items()
+        }
+        self._by_name = {
+            race.name.strip().lower(): race
+            for races in self._by_alignment.values()
+            for race in races
+        }
 
     def list_all(self, alignment: Alignment) -> tuple[Race, ...]:
         return self._by_alignment[alignment]
 
     def find_by_name(self, name: str) -> Optional[Race]:
-        normalized = name.strip().lower()
-        for races in self._by_alignment.values():
-            for race in races:
-                if race.name.lower() == normalized:
-                    return race
-        return None
+        return self._by_name.get(name.strip().lower())
 
     def names_for(self, alignment: Alignment) -> Iterable[str]:
-        return (race.name for race in self.list_all(alignment))
+        return self._names_by_alignment[alignment]
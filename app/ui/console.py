@@ -108,8 +108,12 @@ Resumen actual:
     def _ask_non_negative(self, message: str) -> int:
         while True:
             raw = input(message).strip() or "0"
-            if raw.isdigit():
-                return int(raw)
+            try:
+                value = int(raw)
+            except ValueError:
+                value = -1
+            if value >= 0:
+                return value
             print(" Ingresa un número entero mayor o igual a cero.")
 
     def _show_credits(self) -> None:
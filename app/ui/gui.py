@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import tkinter as tk
+import weakref
 from tkinter import messagebox, ttk
 from typing import Dict
 
@@ -10,7 +11,34 @@ from app.controllers.game_controller import GameController
 from app.domain.alignment import Alignment
 from app.domain.race import Race
 from app.ui.base import UserInterface
-from app.ui.pixel_art import get_sprite, render_sprite
+from app.ui.pixel_art import get_sprite
+
+# Rasterized sprites per Tk root; entries go away together with their root.
+_SPRITE_PHOTOS: weakref.WeakKeyDictionary[tk.Misc, Dict[tuple[str, str, int], tk.PhotoImage]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_sprite_photo(master: tk.Misc, name: str, default_color: str, pixel_size: int) -> tk.PhotoImage:
+    """Return the sprite rasterized once per Tk root, ready for a single ``create_image``.
+
+    The cache is keyed by the root window, so images never outlive the
+    interpreter that owns them and a rebuilt window starts with a fresh set.
+    """
+
+    root = master.nametowidget(".")
+    cache = _SPRITE_PHOTOS.setdefault(root, {})
+    key = (name, default_color, pixel_size)
+    photo = cache.get(key)
+    if photo is None:
+        sprite = get_sprite(name, default_color)
+        photo = tk.PhotoImage(master=root, width=sprite.width * pixel_size, height=sprite.height * pixel_size)
+        for x, y, width, height, color in sprite.rects:
+            x0 = x * pixel_size
+            y0 = y * pixel_size
+            photo.put(color, to=(x0, y0, x0 + width * pixel_size, y0 + height * pixel_size))
+        cache[key] = photo
+    return photo
 
 
 class ArmySelectionPanel(ttk.LabelFrame):
@@ -30,10 +58,15 @@ class ArmySelectionPanel(ttk.LabelFrame):
                 row=row, column=0, sticky=tk.W, padx=(0, 8), pady=4
             )
 
-            sprite_canvas = tk.Canvas(self, width=42, height=42, bd=0, highlightthickness=1, highlightbackground="#333")
-            sprite = get_sprite(race.name, race.pixel_color)
-            render_sprite(sprite_canvas, sprite, 4, 4, pixel_size=4)
-            sprite_canvas.grid(row=row, column=1, padx=(0, 8), pady=4)
+            tk.Label(
+                self,
+                image=get_sprite_photo(self, race.name, race.pixel_color, 4),
+                width=42,
+                height=42,
+                bd=0,
+                highlightthickness=1,
+                highlightbackground="#333",
+            ).grid(row=row, column=1, padx=(0, 8), pady=4)
 
             ttk.Spinbox(
                 self,
@@ -57,7 +90,7 @@ class ArmySelectionPanel(ttk.LabelFrame):
 
 
 class BattleCanvas(tk.Canvas):
-    """Canvas that paints the armies using small coloured rectangles."""
+    """Canvas that paints the armies using cached sprite images."""
 
     def __init__(self, master: tk.Misc) -> None:
         super().__init__(master, width=760, height=260, bg="#0f0f0f", highlightthickness=0)
@@ -91,15 +124,18 @@ class BattleCanvas(tk.Canvas):
             count = roster.get(race.name, 0)
             if count <= 0:
                 continue
-            sprite = get_sprite(race.name, race.pixel_color)
+            photo = get_sprite_photo(self, race.name, race.pixel_color, sprite_pixel)
             for _ in range(count):
                 row, col = divmod(index, per_row)
                 x0 = origin_x + col * (sprite_box + padding)
                 y0 = origin_y + row * (sprite_box + padding)
-                render_sprite(self, sprite, x0, y0, sprite_pixel)
+                self.create_image(x0, y0, anchor=tk.NW, image=photo)
                 index += 1
 
 
+_MUSIC_POLL_MS = 50
+
+
 class GameWindow(UserInterface):
     """Concrete UI implementation backed by Tkinter."""
 
@@ -110,7 +146,8 @@ class GameWindow(UserInterface):
         self._root.resizable(False, False)
         self._music_enabled = tk.BooleanVar(value=True)
         self._build_layout()
-        self._autostart_music()
+        # Deferred so the first frame is drawn before any music work happens.
+        self._root.after_idle(self._autostart_music)
 
     def start(self) -> None:
         self._root.mainloop()
@@ -192,6 +229,13 @@ class GameWindow(UserInterface):
             self._controller.stop_music()
 
     def _autostart_music(self) -> None:
+        if not self._music_enabled.get():
+            return
+        if not self._controller.music_ready():
+            # The track is still rendering in the background; poll instead of
+            # blocking the event loop on it.
+            self._root.after(_MUSIC_POLL_MS, self._autostart_music)
+            return
         if not self._controller.play_music():
             self._music_enabled.set(False)
 
@@ -2,22 +2,77 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Iterable, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterable, Sequence, Tuple
 
 
 @dataclass(frozen=True)
 class PixelSprite:
     palette: Dict[str, str]
     rows: Sequence[str]
+    draw_ops: Tuple[Tuple[int, int, str], ...] = field(init=False, repr=False, compare=False)
+    rects: Tuple[Tuple[int, int, int, int, str], ...] = field(init=False, repr=False, compare=False)
+    width: int = field(init=False, repr=False, compare=False)
+    height: int = field(init=False, repr=False, compare=False)
 
-    @property
-    def height(self) -> int:
-        return len(self.rows)
+    def __post_init__(self) -> None:
+        # Resolve every visible cell to ``(x, y, color)`` once; drawing only replays this.
+        ops = tuple(
+            (x, y, self.palette[code]) for x, y, code in _cell_layout(tuple(self.rows)) if self.palette.get(code)
+        )
+        object.__setattr__(self, "draw_ops", ops)
+        object.__setattr__(self, "rects", _merge_cells(ops))
+        object.__setattr__(self, "width", max((len(row) for row in self.rows), default=0))
+        object.__setattr__(self, "height", len(self.rows))
 
-    @property
-    def width(self) -> int:
-        return max((len(row) for row in self.rows), default=0)
+
+@lru_cache(maxsize=None)
+def _cell_layout(rows: Tuple[str, ...]) -> Tuple[Tuple[int, int, str], ...]:
+    """Non-background ``(x, y, code)`` cells of ``rows``, shared by sprites with the same shape."""
+
+    return tuple((x, y, code) for y, row in enumerate(rows) for x, code in enumerate(row) if code != ".")
+
+
+def _merge_cells(ops: Sequence[Tuple[int, int, str]]) -> Tuple[Tuple[int, int, int, int, str], ...]:
+    """Collapse row-major cells into ``(x, y, width, height, color)`` rectangles.
+
+    Same-colour neighbours in a row become one run, and identical runs on
+    consecutive rows are stacked into a single taller rectangle.
+    """
+
+    runs: list[list] = []
+    for x, y, color in ops:
+        last = runs[-1] if runs else None
+        if last and last[1] == y and last[4] == color and last[0] + last[2] == x:
+            last[2] += 1
+        else:
+            runs.append([x, y, 1, 1, color])
+
+    rects: list[list] = []
+    open_rects: Dict[Tuple[int, int, str], list] = {}
+    for x, y, width, _, color in runs:
+        key = (x, width, color)
+        above = open_rects.get(key)
+        if above and above[1] + above[3] == y:
+            above[3] += 1
+        else:
+            above = [x, y, width, 1, color]
+            rects.append(above)
+            open_rects[key] = above
+    return tuple(tuple(rect) for rect in rects)
+
+
+# Lolo, Fulano, Hoggin, Lurco and Trolli share this silhouette; only the palette differs.
+_H_SKULL_ROWS = (
+    "..HHH..",
+    ".HXXXH.",
+    "HXXEXXH",
+    "HXXXXXH",
+    ".HXXXH.",
+    "..HHH..",
+    "..HHH..",
+)
 
 
 SPRITES: Dict[str, PixelSprite] = {
@@ -29,7 +84,7 @@ SPRITES: Dict[str, PixelSprite] = {
             "OXXEXXO",
             "OXXXXXO",
             ".OXXXO.",
-            "..O O..".replace(" ", "O"),
+            "..OOO..",
             "..OOO..",
         ),
     ),
@@ -40,7 +95,7 @@ SPRITES: Dict[str, PixelSprite] = {
             "..CCC..",
             ".CXXXC.",
             "CXXEXXC",
-            "CXXXXX C".replace(" ", "C"),
+            "CXXXXXCC",
             ".CXXXC.",
             "..CCC..",
         ),
@@ -53,7 +108,7 @@ SPRITES: Dict[str, PixelSprite] = {
             "BXXEXXB",
             "BXXXXXB",
             ".BXXXB.",
-            "..B B..".replace(" ", "B"),
+            "..BBB..",
             "..BBB..",
         ),
     ),
@@ -61,11 +116,11 @@ SPRITES: Dict[str, PixelSprite] = {
         palette={"X": "#e87956", "E": "#2b2b2b", "L": "#ffe6d5"},
         rows=(
             "..LLL..",
-            ".LXXX L".replace(" ", "L"),
+            ".LXXXLL",
             "LXXEXXL",
-            "LXXXXX L".replace(" ", "L"),
-            ".LXXX L".replace(" ", "L"),
-            "..L L..".replace(" ", "L"),
+            "LXXXXXLL",
+            ".LXXXLL",
+            "..LLL..",
             "..LLL..",
         ),
     ),
@@ -75,94 +130,54 @@ SPRITES: Dict[str, PixelSprite] = {
             "..SSS..",
             ".SXXXSS",
             "SXXEXXS",
-            "SXXXXX S".replace(" ", "S"),
+            "SXXXXXSS",
             ".SXXXSS",
-            "..S S..".replace(" ", "S"),
+            "..SSS..",
             "..SSS..",
         ),
     ),
     "Lolo": PixelSprite(
         palette={"X": "#ff6f91", "E": "#200014", "H": "#ff9fb4"},
-        rows=(
-            "..HHH..",
-            ".HXXXH.",
-            "HXXEXXH",
-            "HXXXXXH",
-            ".HXXXH.",
-            "..H H..".replace(" ", "H"),
-            "..HHH..",
-        ),
+        rows=_H_SKULL_ROWS,
     ),
     "Fulano": PixelSprite(
         palette={"X": "#ff9671", "E": "#301205", "H": "#ffba92"},
-        rows=(
-            "..HHH..",
-            ".HXXXH.",
-            "HXXEXXH",
-            "HXXXXXH",
-            ".HXXXH.",
-            "..H H..".replace(" ", "H"),
-            "..HHH..",
-        ),
+        rows=_H_SKULL_ROWS,
     ),
     "Hoggin": PixelSprite(
         palette={"X": "#ffc75f", "E": "#3a2400", "H": "#ffe6a1"},
-        rows=(
-            "..HHH..",
-            ".HXXXH.",
-            "HXXEXXH",
-            "HXXXXXH",
-            ".HXXXH.",
-            "..H H..".replace(" ", "H"),
-            "..HHH..",
-        ),
+        rows=_H_SKULL_ROWS,
     ),
     "Lurco": PixelSprite(
         palette={"X": "#a17fe0", "E": "#1c0f33", "H": "#c4a8ff"},
-        rows=(
-            "..HHH..",
-            ".HXXXH.",
-            "HXXEXXH",
-            "HXXXXXH",
-            ".HXXXH.",
-            "..H H..".replace(" ", "H"),
-            "..HHH..",
-        ),
+        rows=_H_SKULL_ROWS,
     ),
     "Trolli": PixelSprite(
         palette={"X": "#5c5470", "E": "#f0f0f0", "H": "#8e85a6"},
-        rows=(
-            "..HHH..",
-            ".HXXXH.",
-            "HXXEXXH",
-            "HXXXXXH",
-            ".HXXXH.",
-            "..H H..".replace(" ", "H"),
-            "..HHH..",
-        ),
+        rows=_H_SKULL_ROWS,
     ),
 }
 
 
 def render_sprite(canvas, sprite: PixelSprite, origin_x: int, origin_y: int, pixel_size: int) -> None:
-    """Draw ``sprite`` onto ``canvas`` using ``pixel_size`` squares."""
+    """Draw ``sprite`` onto ``canvas`` scaling each pixel to ``pixel_size``."""
+
+    for x, y, width, height, color in sprite.rects:
+        x0 = origin_x + x * pixel_size
+        y0 = origin_y + y * pixel_size
+        canvas.create_rectangle(
+            x0, y0, x0 + width * pixel_size, y0 + height * pixel_size, fill=color, outline=""
+        )
+
 
-    for y, row in enumerate(sprite.rows):
-        for x, code in enumerate(row):
-            if code == ".":
-                continue
-            color = sprite.palette.get(code)
-            if not color:
-                continue
-            x0 = origin_x + x * pixel_size
-            y0 = origin_y + y * pixel_size
-            canvas.create_rectangle(x0, y0, x0 + pixel_size, y0 + pixel_size, fill=color, outline="")
+_SPRITE_NAMES = tuple(SPRITES)
 
 
 def sprite_names() -> Iterable[str]:
-    return SPRITES.keys()
+    return _SPRITE_NAMES
 
 
+@lru_cache(maxsize=128)
 def get_sprite(name: str, default_color: str) -> PixelSprite:
     sprite = SPRITES.get(name)
     if sprite:
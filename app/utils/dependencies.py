@@ -1,10 +1,8 @@
-"""Utility helpers to ensure optional runtime dependencies are installed."""
+"""Utility helpers to check that optional runtime dependencies are available."""
 
 from __future__ import annotations
 
-import importlib
-import subprocess
-import sys
+import importlib.util
 from dataclasses import dataclass
 from typing import Dict
 
@@ -18,30 +16,21 @@ class DependencyCheck:
 
 PYPI_DEPENDENCIES: Dict[str, DependencyCheck] = {
     "pygame": DependencyCheck(module="pygame", package="pygame", optional=True),
+    "numpy": DependencyCheck(module="numpy", package="numpy", optional=True),
 }
 
 
-def ensure_optional_dependencies() -> None:
-    """Attempt to install any missing optional dependencies from PyPI."""
-
-    for check in PYPI_DEPENDENCIES.values():
-        try:
-            importlib.import_module(check.module)
-        except ModuleNotFoundError:
-            install_dependency(check)
-
-
 def install_dependency(check: DependencyCheck) -> None:
-    """Install ``check.package`` via pip using the current interpreter."""
-
-    print(f"Instalando dependencia opcional '{check.package}'...")
-    result = subprocess.run(
-        [sys.executable, "-m", "pip", "install", check.package],
-        check=False,
+    """Tell the user how to install ``check.package`` instead of running pip.
+
+    Required packages raise ``RuntimeError``; optional ones only print a hint.
+    """
+
+    if importlib.util.find_spec(check.module) is not None:
+        return
+    if not check.optional:
+        raise RuntimeError(f"Falta la dependencia requerida: {check.package} (pip install {check.package})")
+    print(
+        f"Advertencia: falta la dependencia opcional '{check.package}'. "
+        f"Instálala con `pip install {check.package}` para habilitar todas las características."
     )
-    if result.returncode != 0 and not check.optional:
-        raise RuntimeError(f"No se pudo instalar la dependencia requerida: {check.package}")
-    if result.returncode != 0:
-        print(
-            f"Advertencia: no se pudo instalar '{check.package}'. Algunas características opcionales pueden no funcionar."
-        )
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-import argparse
-from typing import Callable
+import sys
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Callable, Optional, Protocol, Sequence
 
 from app.controllers.game_controller import GameController
 from app.infrastructure.music import RetroMusicPlayer
@@ -13,7 +15,15 @@ from app.services.race_catalog import RaceCatalog
 from app.ui.base import UserInterface
 from app.ui.console import ConsoleUI
 from app.ui.menu import InterfaceMode, prompt_mode
-from app.utils.dependencies import ensure_optional_dependencies
+
+_DEFAULT_MODE = "menu"
+
+
+class LaunchOptions(Protocol):
+    """Command-line options read by :func:`main`."""
+
+    mode: str
+    no_music: bool
 
 
 def build_controller(enable_music: bool) -> GameController:
@@ -31,13 +41,13 @@ def build_controller(enable_music: bool) -> GameController:
     )
 
 
-def build_ui(mode: InterfaceMode, controller: GameController) -> UserInterface:
-    if mode is InterfaceMode.CONSOLE:
-        return ConsoleUI(controller)
+@lru_cache(maxsize=None)
+def _load_game_window() -> Optional[Callable[[GameController], UserInterface]]:
+    """Import the Tkinter window once; a failed probe is remembered and reported once."""
 
     try:
         from app.ui.gui import GameWindow
-    except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency
+    except ModuleNotFoundError:  # pragma: no cover - optional dependency
         print(
             "No se encontró Tkinter, se continuará automáticamente en modo consola.\n"
             "Sugerencias para habilitar la interfaz gráfica:\n"
@@ -47,17 +57,33 @@ def build_ui(mode: InterfaceMode, controller: GameController) -> UserInterface:
             "  • Linux Debian/Ubuntu: `sudo apt install python3-tk`.\n"
             "  • Fedora/RHEL: `sudo dnf install python3-tkinter`.\n"
         )
+        return None
+    return GameWindow
+
+
+def build_ui(mode: InterfaceMode, controller: GameController) -> UserInterface:
+    if mode is InterfaceMode.CONSOLE:
         return ConsoleUI(controller)
 
-    return GameWindow(controller)
+    window_cls = _load_game_window()
+    if window_cls is None:
+        return ConsoleUI(controller)
+    return window_cls(controller)
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> LaunchOptions:
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        # Plain `python main.py`: skip importing and building the parser.
+        return SimpleNamespace(mode=_DEFAULT_MODE, no_music=False)
 
+    import argparse
 
-def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Simulador de la batalla por Centauro")
     parser.add_argument(
         "--mode",
-        choices=[mode.value for mode in InterfaceMode] + ["menu"],
-        default="menu",
+        choices=[mode.value for mode in InterfaceMode] + [_DEFAULT_MODE],
+        default=_DEFAULT_MODE,
         help="Modo de interacción: console, gui o menu (por defecto)",
     )
     parser.add_argument(
@@ -65,13 +91,12 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Desactiva la carga del reproductor de música retro",
     )
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 def main() -> None:
-    ensure_optional_dependencies()
     args = parse_args()
-    if args.mode == "menu":
+    if args.mode == _DEFAULT_MODE:
         mode = prompt_mode()
     else:
         mode = InterfaceMode(args.mode)
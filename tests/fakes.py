@@ -0,0 +1,112 @@
+"""Minimal stand-ins for the parts of ``pygame.mixer`` the music player uses."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+
+class FakeChannel:
+    __slots__ = ("_busy", "stop_calls", "_get_busy_impl", "_stop_impl")
+
+    def __init__(self) -> None:
+        self._busy = False
+        self.stop_calls = 0
+        # Failures are armed by swapping in a one-shot implementation, so the
+        # normal calls carry no flag checks.
+        self._get_busy_impl = self._report_busy
+        self._stop_impl = self._halt
+
+    def arm_get_busy_failure(self) -> None:
+        self._get_busy_impl = self._fail_get_busy_once
+
+    def arm_stop_failure(self) -> None:
+        self._stop_impl = self._fail_stop_once
+
+    def start(self) -> None:
+        self._busy = True
+
+    def stop(self) -> None:
+        self.stop_calls += 1
+        self._stop_impl()
+
+    def get_busy(self) -> bool:
+        return self._get_busy_impl()
+
+    def _report_busy(self) -> bool:
+        return self._busy
+
+    def _halt(self) -> None:
+        self._busy = False
+
+    def _fail_get_busy_once(self) -> bool:
+        self._get_busy_impl = self._report_busy
+        raise RuntimeError("busy check failure")
+
+    def _fail_stop_once(self) -> None:
+        self._stop_impl = self._halt
+        raise RuntimeError("channel stop failure")
+
+
+class FakeSound:
+    __slots__ = ("buffer", "play_calls", "stop_calls", "_channel", "raise_on_play")
+
+    def __init__(self, buffer: bytes) -> None:
+        self.buffer = buffer
+        self.play_calls = 0
+        self.stop_calls = 0
+        self._channel = FakeChannel()
+        self.raise_on_play = False
+
+    def play(self, loops: int = -1) -> FakeChannel:
+        if self.raise_on_play:
+            self.raise_on_play = False
+            raise RuntimeError("sound play failure")
+        self.play_calls += 1
+        self._channel.start()
+        return self._channel
+
+    def stop(self) -> None:
+        self.stop_calls += 1
+        self._channel.stop()
+
+
+class FakeMusic:
+    __slots__ = ("play_calls", "stop_calls", "last_loaded_path")
+
+    def __init__(self) -> None:
+        self.play_calls = 0
+        self.stop_calls = 0
+        self.last_loaded_path: Optional[str] = None
+
+    def load(self, *_args, **_kwargs) -> None:
+        if _args:
+            self.last_loaded_path = _args[0]
+
+    def play(self, loops: int = -1) -> None:
+        self.play_calls += 1
+
+    def stop(self) -> None:
+        self.stop_calls += 1
+
+
+class FakeMixer:
+    __slots__ = ("init_count", "last_sound", "music", "raise_on_sound")
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.init_count = 0
+        self.last_sound: Optional[FakeSound] = None
+        self.music = FakeMusic()
+        self.raise_on_sound = False
+
+    def init(self, **_kwargs) -> None:
+        self.init_count += 1
+
+    def Sound(self, buffer: bytes) -> FakeSound:
+        if self.raise_on_sound:
+            raise RuntimeError("Sound init failure")
+        sound = FakeSound(buffer)
+        self.last_sound = sound
+        return sound
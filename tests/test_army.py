@@ -6,9 +6,12 @@ from app.domain.race import Race
 
 
 class ArmyTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.osito = Race(name="Osito", alignment=Alignment.BENEVOLENT, battle_value=1, pixel_color="#fff")
+        cls.hoggin = Race(name="Hoggin", alignment=Alignment.MALEVOLENT, battle_value=2, pixel_color="#333")
+
     def setUp(self) -> None:
-        self.osito = Race(name="Osito", alignment=Alignment.BENEVOLENT, battle_value=1, pixel_color="#fff")
-        self.hoggin = Race(name="Hoggin", alignment=Alignment.MALEVOLENT, battle_value=2, pixel_color="#333")
         self.good_army = Army(Alignment.BENEVOLENT)
 
     def test_set_units_validates_alignment_and_updates_roster(self) -> None:
@@ -22,3 +25,47 @@ class ArmyTestCase(unittest.TestCase):
         # Setting to zero removes the race from the roster.
         self.good_army.set_units(self.osito, 0)
         self.assertEqual({}, self.good_army.snapshot())
+
+    def test_totals_follow_updates_and_clear(self) -> None:
+        principe = Race(name="Principe", alignment=Alignment.BENEVOLENT, battle_value=2, pixel_color="#00f")
+        self.good_army.set_units(self.osito, 3)
+        self.good_army.set_units(principe, 4)
+        self.assertEqual((7, 11), (self.good_army.total_units(), self.good_army.total_power()))
+
+        self.good_army.set_units(principe, 1)
+        self.good_army.set_units(self.osito, -5)
+        self.assertEqual((1, 2), (self.good_army.total_units(), self.good_army.total_power()))
+
+        self.good_army.clear()
+        self.assertEqual((0, 0), (self.good_army.total_units(), self.good_army.total_power()))
+        self.assertEqual({}, self.good_army.snapshot())
+
+    def test_totals_include_initial_roster(self) -> None:
+        army = Army(Alignment.BENEVOLENT, roster={self.osito: 5})
+        self.assertEqual((5, 5), (army.total_units(), army.total_power()))
+
+        fulo = Race(name="Fulo", alignment=Alignment.BENEVOLENT, battle_value=5, pixel_color="#000")
+        army = Army(Alignment.BENEVOLENT, roster={fulo: -3, self.osito: 0})
+        self.assertEqual({}, army.snapshot())
+        self.assertEqual((0, 0), (army.total_units(), army.total_power()))
+        army.set_units(fulo, 2)
+        self.assertEqual((2, 10), (army.total_units(), army.total_power()))
+
+        with self.assertRaises(ValueError):
+            Army(Alignment.BENEVOLENT, roster={self.hoggin: 1})
+
+    def test_totals_use_race_compute_power(self) -> None:
+        class Elite(Race):
+            __slots__ = ()
+
+            def compute_power(self, troops: int) -> int:
+                return super().compute_power(troops) + (10 if troops > 0 else 0)
+
+        elite = Elite(name="Elite", alignment=Alignment.BENEVOLENT, battle_value=3, pixel_color="#f00")
+        army = Army(Alignment.BENEVOLENT, roster={elite: 2})
+        self.assertEqual(16, army.total_power())
+
+        army.set_units(elite, 4)
+        self.assertEqual(22, army.total_power())
+        army.set_units(elite, 0)
+        self.assertEqual(0, army.total_power())
@@ -8,9 +8,10 @@ from app.services.race_catalog import RaceCatalog
 
 
 class BattleServiceTestCase(unittest.TestCase):
-    def setUp(self) -> None:
-        self.catalog = RaceCatalog()
-        self.service = BattleService()
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.catalog = RaceCatalog()
+        cls.service = BattleService()
 
     def _army_with(self, alignment: Alignment, composition: dict[str, int]) -> Army:
         army = Army(alignment)
@@ -0,0 +1,24 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from app.utils.dependencies import DependencyCheck, install_dependency
+
+
+class DependenciesTestCase(unittest.TestCase):
+    def test_missing_optional_dependency_only_prints_hint(self) -> None:
+        output = io.StringIO()
+        with redirect_stdout(output):
+            install_dependency(DependencyCheck(module="modulo_inexistente", package="paquete-inexistente"))
+        self.assertIn("pip install paquete-inexistente", output.getvalue())
+
+    def test_missing_required_dependency_raises(self) -> None:
+        check = DependencyCheck(module="modulo_inexistente", package="paquete-inexistente", optional=False)
+        with self.assertRaises(RuntimeError):
+            install_dependency(check)
+
+    def test_available_dependency_is_silent(self) -> None:
+        output = io.StringIO()
+        with redirect_stdout(output):
+            install_dependency(DependencyCheck(module="json", package="json", optional=False))
+        self.assertEqual("", output.getvalue())
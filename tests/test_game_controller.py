@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 
 from app.controllers.game_controller import GameController
 from app.domain.alignment import Alignment
@@ -41,12 +42,16 @@ class FakeMusicPlayer(MusicPlayer):
 
 
 class GameControllerTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.catalog = RaceCatalog()
+        cls.service = BattleService()
+
     def setUp(self) -> None:
-        self.catalog = RaceCatalog()
         self.storage = FakeStorage()
         self.music = FakeMusicPlayer(available=True)
         self.controller = GameController(
-            battle_service=BattleService(),
+            battle_service=self.service,
             race_catalog=self.catalog,
             storage=self.storage,
             music_player=self.music,
@@ -84,7 +89,7 @@ class GameControllerTestCase(unittest.TestCase):
 
         unavailable_player = FakeMusicPlayer(available=False)
         controller = GameController(
-            battle_service=BattleService(),
+            battle_service=self.service,
             race_catalog=self.catalog,
             storage=self.storage,
             music_player=unavailable_player,
@@ -118,7 +123,7 @@ class GameControllerTestCase(unittest.TestCase):
         self.storage.saved[Alignment.MALEVOLENT.name] = {"Hoggin": 1}
 
         controller = GameController(
-            battle_service=BattleService(),
+            battle_service=self.service,
             race_catalog=self.catalog,
             storage=self.storage,
             music_player=self.music,
@@ -131,7 +136,7 @@ class GameControllerTestCase(unittest.TestCase):
 
     def test_optional_dependencies_absent(self) -> None:
         controller = GameController(
-            battle_service=BattleService(),
+            battle_service=self.service,
             race_catalog=self.catalog,
             storage=None,
             music_player=None,
@@ -139,6 +144,13 @@ class GameControllerTestCase(unittest.TestCase):
         self.assertFalse(controller.play_music())
         controller.reset_armies()  # Should not raise even without storage.
 
+    def test_music_ready_follows_player(self) -> None:
+        self.assertTrue(self.controller.music_ready())
+        with mock.patch.object(FakeMusicPlayer, "is_ready", new_callable=mock.PropertyMock, return_value=False):
+            self.assertFalse(self.controller.music_ready())
+        self.controller.music_player = None
+        self.assertTrue(self.controller.music_ready())
+
     def test_fake_music_player_unavailable_play(self) -> None:
         player = FakeMusicPlayer(available=False)
         self.assertFalse(player.play())
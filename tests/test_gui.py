@@ -0,0 +1,76 @@
+import types
+import unittest
+
+try:
+    from app.ui.gui import _MUSIC_POLL_MS, GameWindow
+except ImportError:  # pragma: no cover - Tkinter is optional
+    GameWindow = None
+
+
+class FakeRoot:
+    def __init__(self) -> None:
+        self.scheduled = []
+
+    def after(self, delay: int, callback) -> None:
+        self.scheduled.append((delay, callback))
+
+
+class FakeVar:
+    def __init__(self, value: bool) -> None:
+        self.value = value
+
+    def get(self) -> bool:
+        return self.value
+
+    def set(self, value: bool) -> None:
+        self.value = value
+
+
+class FakeController:
+    def __init__(self, ready: bool, plays: bool = True) -> None:
+        self.ready = ready
+        self.plays = plays
+        self.play_calls = 0
+
+    def music_ready(self) -> bool:
+        return self.ready
+
+    def play_music(self) -> bool:
+        self.play_calls += 1
+        return self.plays
+
+
+@unittest.skipIf(GameWindow is None, "Tkinter no disponible")
+class AutostartMusicTestCase(unittest.TestCase):
+    """Exercise the autostart logic without a display, using stand-ins for the Tk pieces."""
+
+    def _window(self, controller: FakeController, enabled: bool = True) -> types.SimpleNamespace:
+        window = types.SimpleNamespace(_controller=controller, _root=FakeRoot(), _music_enabled=FakeVar(enabled))
+        window._autostart_music = lambda: GameWindow._autostart_music(window)
+        return window
+
+    def test_polls_while_track_renders_then_plays(self) -> None:
+        controller = FakeController(ready=False)
+        window = self._window(controller)
+
+        window._autostart_music()
+        self.assertEqual(0, controller.play_calls)
+        self.assertEqual(_MUSIC_POLL_MS, window._root.scheduled[0][0])
+
+        controller.ready = True
+        window._root.scheduled[0][1]()
+        self.assertEqual(1, controller.play_calls)
+        self.assertTrue(window._music_enabled.get())
+
+    def test_user_disabling_music_stops_polling(self) -> None:
+        controller = FakeController(ready=False)
+        window = self._window(controller, enabled=False)
+
+        window._autostart_music()
+        self.assertEqual([], window._root.scheduled)
+        self.assertEqual(0, controller.play_calls)
+
+    def test_failed_start_unchecks_music(self) -> None:
+        window = self._window(FakeController(ready=True, plays=False))
+        window._autostart_music()
+        self.assertFalse(window._music_enabled.get())
@@ -0,0 +1,14 @@
+import unittest
+
+import main
+
+
+class ParseArgsTestCase(unittest.TestCase):
+    def test_fast_path_matches_parser_defaults(self) -> None:
+        fast = main.parse_args([])
+        parsed = main.parse_args(["--mode", "menu"])
+        self.assertEqual((parsed.mode, parsed.no_music), (fast.mode, fast.no_music))
+
+    def test_no_music_flag(self) -> None:
+        args = main.parse_args(["--mode", "console", "--no-music"])
+        self.assertEqual(("console", True), (args.mode, args.no_music))
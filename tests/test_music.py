@@ -1,121 +1,72 @@
 from __future__ import annotations
 
+import subprocess
 import sys
 import tempfile
+import threading
 import types
+from array import array
 from pathlib import Path
-from unittest import TestCase
+from typing import Final
+from unittest import TestCase, mock, skipIf
 
-from app.infrastructure.music import ProceduralChiptune, RetroMusicPlayer
+from app.infrastructure import music
+from app.infrastructure.music import ProceduralChiptune, RetroMusicPlayer, midi_to_frequency
+from tests.fakes import FakeMixer, FakeSound
 
-
-class FakeChannel:
-    def __init__(self) -> None:
-        self._busy = False
-        self.stop_calls = 0
-        self.raise_on_get_busy = False
-        self.raise_on_stop = False
-
-    def start(self) -> None:
-        self._busy = True
-
-    def stop(self) -> None:
-        self.stop_calls += 1
-        if self.raise_on_stop:
-            self.raise_on_stop = False
-            raise RuntimeError("channel stop failure")
-        self._busy = False
-
-    def get_busy(self) -> bool:
-        if self.raise_on_get_busy:
-            self.raise_on_get_busy = False
-            raise RuntimeError("busy check failure")
-        return self._busy
-
-
-class FakeSound:
-    def __init__(self, buffer: bytes) -> None:
-        self.buffer = buffer
-        self.play_calls = 0
-        self.stop_calls = 0
-        self._channel = FakeChannel()
-        self.raise_on_play = False
-
-    def play(self, loops: int = -1) -> FakeChannel:
-        if self.raise_on_play:
-            self.raise_on_play = False
-            raise RuntimeError("sound play failure")
-        self.play_calls += 1
-        self._channel.start()
-        return self._channel
-
-    def stop(self) -> None:
-        self.stop_calls += 1
-        self._channel.stop()
-
-
-class FakeMusic:
-    def __init__(self) -> None:
-        self.play_calls = 0
-        self.stop_calls = 0
-        self.loaded_paths: list[str] = []
-
-    def load(self, *_args, **_kwargs) -> None:
-        if _args:
-            self.loaded_paths.append(_args[0])
-
-    def play(self, loops: int = -1) -> None:
-        self.play_calls += 1
-
-    def stop(self) -> None:
-        self.stop_calls += 1
-
-
-class FakeMixer:
-    def __init__(self) -> None:
-        self.init_calls = []
-        self.sound_instances: list[FakeSound] = []
-        self.music = FakeMusic()
-        self.raise_on_sound = False
-
-    def init(self, **kwargs) -> None:
-        self.init_calls.append(kwargs)
-
-    def Sound(self, buffer: bytes) -> FakeSound:
-        if self.raise_on_sound:
-            raise RuntimeError("Sound init failure")
-        sound = FakeSound(buffer)
-        self.sound_instances.append(sound)
-        return sound
+_NONEXISTENT_AUDIO: Final[Path] = Path("nonexistent.mp3")
+_THEME_AUDIO: Final[Path] = Path("theme.mp3")
+_SILENT_LOOP: Final[bytes] = bytes(64)
 
 
 class RetroMusicPlayerTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # One fake pygame serves the whole case; setUp only resets its counters.
+        previous = sys.modules.get("pygame")
+        cls.fake_mixer = FakeMixer()
+        sys.modules["pygame"] = types.SimpleNamespace(mixer=cls.fake_mixer)
+        cls.addClassCleanup(cls._restore_pygame, previous)
+
+        # Synthesis has its own tests below; here a short silent loop keeps each
+        # player construction from rendering the full default theme.
+        render_patch = mock.patch.object(ProceduralChiptune, "render_loop", return_value=_SILENT_LOOP)
+        render_patch.start()
+        cls.addClassCleanup(render_patch.stop)
+
+    @staticmethod
+    def _restore_pygame(previous: object) -> None:
+        if previous is None:
+            sys.modules.pop("pygame", None)
+        else:
+            sys.modules["pygame"] = previous
+
     def setUp(self) -> None:
         RetroMusicPlayer._reset_singleton()
-        sys.modules.pop("pygame", None)
-        self.tmpdir = tempfile.TemporaryDirectory()
-
-        fake_pygame = types.SimpleNamespace()
-        fake_pygame.mixer = FakeMixer()
-        sys.modules["pygame"] = fake_pygame
-        self.fake_mixer = fake_pygame.mixer
+        self.fake_mixer.reset()
 
     def tearDown(self) -> None:
         RetroMusicPlayer._reset_singleton()
-        sys.modules.pop("pygame", None)
-        self.tmpdir.cleanup()
+
+    def _make_playing(self) -> tuple[RetroMusicPlayer, FakeSound]:
+        player = RetroMusicPlayer(audio_path=None)
+        self.assertTrue(player.play())
+        return player, self.fake_mixer.last_sound
+
+    def _make_tmpdir(self) -> Path:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        return Path(tmpdir.name)
 
     def test_singleton_reuses_same_instance(self) -> None:
-        player_a = RetroMusicPlayer(audio_path=Path("nonexistent.mp3"))
+        player_a = RetroMusicPlayer(audio_path=_NONEXISTENT_AUDIO)
         player_b = RetroMusicPlayer()
         self.assertIs(player_a, player_b)
         # mixer.init called only once even with repeated instantiation
-        self.assertEqual(1, len(self.fake_mixer.init_calls))
+        self.assertEqual(1, self.fake_mixer.init_count)
 
     def test_play_does_not_overlap_existing_channel(self) -> None:
-        player = RetroMusicPlayer(audio_path=None)
-        self.assertTrue(player.play())
-        sound = self.fake_mixer.sound_instances[0]
+        player, sound = self._make_playing()
         self.assertEqual(1, sound.play_calls)
 
         # Second play while channel busy should not trigger another call.
@@ -137,18 +88,18 @@ class RetroMusicPlayerTestCase(TestCase):
         self.assertIsNot(first, second)
         self.assertEqual(
             2,
-            len(self.fake_mixer.init_calls),
+            self.fake_mixer.init_count,
             "pygame mixer should initialize again after resetting singleton",
         )
 
     def test_uses_existing_audio_file_and_music_channel(self) -> None:
-        audio_file = Path(self.tmpdir.name) / "theme.mp3"
-        audio_file.write_bytes(b"stub")
-
-        player = RetroMusicPlayer(audio_path=audio_file)
+        # FakeMusic.load only records the path, so the file never has to exist on disk.
+        audio_file = _THEME_AUDIO
+        with mock.patch.object(Path, "exists", autospec=True, return_value=True):
+            player = RetroMusicPlayer(audio_path=audio_file)
         self.assertTrue(player.is_available)
-        self.assertEqual([], self.fake_mixer.sound_instances)
-        self.assertIn(audio_file.as_posix(), self.fake_mixer.music.loaded_paths)
+        self.assertIsNone(self.fake_mixer.last_sound)
+        self.assertEqual(audio_file.as_posix(), self.fake_mixer.music.last_loaded_path)
 
         self.assertTrue(player.play())
         self.assertEqual(1, self.fake_mixer.music.play_calls)
@@ -165,27 +116,51 @@ class RetroMusicPlayerTestCase(TestCase):
         self.assertFalse(player.play())
         self.fake_mixer.raise_on_sound = False
 
+    def test_missing_pygame_reports_install_hint(self) -> None:
+        with (
+            mock.patch.dict(sys.modules, {"pygame": None}),
+            mock.patch.object(music, "install_dependency") as install,
+        ):
+            player = RetroMusicPlayer(audio_path=None)
+
+        install.assert_called_once_with(music.PYPI_DEPENDENCIES["pygame"])
+        self.assertFalse(player.is_available)
+
+    def test_missing_numpy_reports_install_hint(self) -> None:
+        with (
+            mock.patch.object(music, "_numpy", return_value=None),
+            mock.patch.object(music, "install_dependency") as install,
+        ):
+            player = RetroMusicPlayer(audio_path=None)
+            # The hint comes from the render thread; is_available waits for it.
+            self.assertTrue(player.is_available)
+
+        install.assert_called_once_with(music.PYPI_DEPENDENCIES["numpy"])
+
+    def test_importing_music_does_not_import_numpy(self) -> None:
+        code = "import sys, app.infrastructure.music; print('numpy' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        self.assertEqual("False", result.stdout.strip())
+
     def test_channel_get_busy_exception_is_ignored(self) -> None:
-        player = RetroMusicPlayer(audio_path=None)
-        player.play()
-        sound = self.fake_mixer.sound_instances[0]
-        sound._channel.raise_on_get_busy = True
+        player, sound = self._make_playing()
+        sound._channel.arm_get_busy_failure()
 
         self.assertTrue(player.play())
         self.assertEqual(2, sound.play_calls)
 
     def test_sound_play_exception_returns_false(self) -> None:
         player = RetroMusicPlayer(audio_path=None)
-        sound = self.fake_mixer.sound_instances[0]
+        self.assertTrue(player.is_available)
+        sound = self.fake_mixer.last_sound
         sound.raise_on_play = True
 
         self.assertFalse(player.play())
 
     def test_stop_handles_channel_errors(self) -> None:
-        player = RetroMusicPlayer(audio_path=None)
-        player.play()
-        sound = self.fake_mixer.sound_instances[0]
-        sound._channel.raise_on_stop = True
+        player, sound = self._make_playing()
+        sound._channel.arm_stop_failure()
 
         player.stop()  # Should swallow the exception and not raise.
 
@@ -198,21 +173,108 @@ class RetroMusicPlayerTestCase(TestCase):
         player.stop = failing_stop  # type: ignore[assignment]
         RetroMusicPlayer._reset_singleton()
 
+    def test_seeded_payload_is_cached_on_disk(self) -> None:
+        cache_dir = self._make_tmpdir() / "cache"
+        params = dict(sample_rate=8000, bpm=96, bars=1, steps_per_bar=4, seed=11, cache_dir=cache_dir)
+        music._seeded_payload.cache_clear()
+        first = RetroMusicPlayer(audio_path=None, **params)
+        self.assertTrue(first.is_available)
+        first_sound = self.fake_mixer.last_sound
+        self.assertEqual(1, len(list(cache_dir.glob("chiptune-*.pcm"))))
+
+        RetroMusicPlayer._reset_singleton()
+        music._seeded_payload.cache_clear()
+        with mock.patch.object(ProceduralChiptune, "render_loop", side_effect=AssertionError("rendered")):
+            second = RetroMusicPlayer(audio_path=None, **params)
+            self.assertTrue(second.is_available)
+        self.assertIsNot(first_sound, self.fake_mixer.last_sound)
+        self.assertEqual(first_sound.buffer, self.fake_mixer.last_sound.buffer)
+        music._seeded_payload.cache_clear()
+
+    def test_render_runs_in_background_until_needed(self) -> None:
+        release = threading.Event()
+
+        def slow_render(_self: ProceduralChiptune) -> bytes:
+            release.wait(5)
+            return b"\x00\x00"
+
+        with mock.patch.object(ProceduralChiptune, "render_loop", slow_render):
+            player = RetroMusicPlayer(audio_path=None)
+            self.assertIsNone(self.fake_mixer.last_sound)
+            self.assertFalse(player.is_ready)
+            release.set()
+            self.assertTrue(player.play())
+            self.assertTrue(player.is_ready)
+        self.assertIsNotNone(self.fake_mixer.last_sound)
+
+    def test_stop_during_render_does_not_block(self) -> None:
+        release = threading.Event()
+
+        def slow_render(_self: ProceduralChiptune) -> bytes:
+            release.wait(5)
+            return b"\x00\x00"
+
+        with mock.patch.object(ProceduralChiptune, "render_loop", slow_render):
+            player = RetroMusicPlayer(audio_path=None)
+            player.stop()
+            self.assertFalse(player.is_ready)
+            release.set()
+            self.assertTrue(player.is_available)
+
+
+class ProceduralChiptuneTestCase(TestCase):
+    """Synthesizer tests; they need neither the fake pygame nor a temp dir."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Pattern builders only read the settings and the RNG, so one generator serves every test.
+        cls.generator = ProceduralChiptune(sample_rate=22050, bpm=80, bars=1, steps_per_bar=4, seed=1)
+
     def test_minor_progression_adjusts_dominant(self) -> None:
-        generator = ProceduralChiptune(sample_rate=22050, bpm=80, bars=1, steps_per_bar=4, seed=1)
-        original_progressions = ProceduralChiptune._PROGRESSIONS
-        try:
-            ProceduralChiptune._PROGRESSIONS = (("v",),)
-            generator._scale_mode = "minor"
-            progression = generator._build_progression(root=50)
-        finally:
-            ProceduralChiptune._PROGRESSIONS = original_progressions
+        with (
+            mock.patch.object(ProceduralChiptune, "_PROGRESSIONS", (("v",),)),
+            mock.patch.object(self.generator, "_scale_mode", "minor", create=True),
+        ):
+            progression = self.generator._build_progression(root=50)
         self.assertEqual([58], progression)
 
     def test_harmony_and_bass_skip_when_remaining_zero(self) -> None:
-        generator = ProceduralChiptune(sample_rate=22050, bpm=80, bars=1, steps_per_bar=4, seed=1)
         progression = [60]
-        harmony = generator._build_harmony_pattern(progression, total_steps=0)
-        bass = generator._build_bass_pattern(progression, total_steps=0)
+        harmony = self.generator._build_harmony_pattern(progression, total_steps=0)
+        bass = self.generator._build_bass_pattern(progression, total_steps=0)
         self.assertEqual([], harmony)
         self.assertEqual([], bass)
+
+    @skipIf(music._numpy() is None, "NumPy no disponible")
+    def test_vectorized_render_matches_pure_python(self) -> None:
+        params = dict(sample_rate=8000, bpm=96, bars=2, steps_per_bar=4, seed=3)
+        vectorized = array("h", ProceduralChiptune(**params).render_loop())
+        with mock.patch.object(music, "_numpy", return_value=None):
+            fallback = array("h", ProceduralChiptune(**params).render_loop())
+
+        self.assertEqual(len(fallback), len(vectorized))
+        # The vectorized path reads sines from a lookup table, so a handful of
+        # square-wave edges may land one sample apart from the exact render.
+        outliers = sum(abs(a - b) > 64 for a, b in zip(fallback, vectorized))
+        self.assertLess(outliers, len(fallback) // 1000)
+
+    @skipIf(music._numpy() is None, "NumPy no disponible")
+    def test_envelope_array_is_cached_and_matches_levels(self) -> None:
+        envelope = music._envelope_array(64, 0.18, 0.42, 0.72)
+        self.assertIs(envelope, music._envelope_array(64, 0.18, 0.42, 0.72))
+        self.assertFalse(envelope.flags.writeable)
+        self.assertEqual(list(music._envelope_levels(64, 0.18, 0.42, 0.72)), envelope.tolist())
+
+    @skipIf(music._numpy() is None, "NumPy no disponible")
+    def test_poly_blep_matches_scalar_kernel(self) -> None:
+        phases = [0.0, 0.005, 0.02, 0.5, 0.985, 0.999]
+        residual = music._poly_blep(music._numpy().array(phases), 0.02).tolist()
+        for phase, value in zip(phases, residual):
+            self.assertAlmostEqual(music._blep_sample(phase, 0.02), value)
+        self.assertEqual(-1.0, residual[0])
+        self.assertEqual(0.0, residual[3])
+
+    def test_midi_to_frequency_table_matches_formula(self) -> None:
+        self.assertEqual(440.0, midi_to_frequency(69))
+        for note in (0, 40, 60, 127, 128, -1):
+            self.assertAlmostEqual(440.0 * (2 ** ((note - 69) / 12)), midi_to_frequency(note))
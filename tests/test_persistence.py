@@ -1,26 +1,45 @@
 import json
+import os
 import tempfile
 import unittest
 from pathlib import Path
+from types import MappingProxyType
 
 from app.domain.alignment import Alignment
 from app.infrastructure.persistence import JsonArmyStorage
 
 
+_SHARED_MEMORY_DIR = "/dev/shm"
+_ROSTER_IN = MappingProxyType({"Osito": 3, "Principe": 2, "Invalido": 0})
+_ROSTER_EXPECTED = MappingProxyType({"Osito": 3, "Principe": 2})
+
+
+def _fast_tmpdir() -> tempfile.TemporaryDirectory:
+    """Use the memory-backed ``/dev/shm`` when available so tests avoid disk I/O."""
+
+    if os.path.isdir(_SHARED_MEMORY_DIR) and os.access(_SHARED_MEMORY_DIR, os.W_OK):
+        return tempfile.TemporaryDirectory(dir=_SHARED_MEMORY_DIR)
+    return tempfile.TemporaryDirectory()
+
+
 class JsonArmyStorageTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        tmpdir = _fast_tmpdir()
+        cls.addClassCleanup(tmpdir.cleanup)
+        cls.root = Path(tmpdir.name)
+
     def setUp(self) -> None:
-        self.tmpdir = tempfile.TemporaryDirectory()
-        self.path = Path(self.tmpdir.name) / "armies.json"
+        # Each test gets its own subdirectory of the shared temp dir.
+        self.workdir = self.root / self._testMethodName
+        self.workdir.mkdir()
+        self.path = self.workdir / "armies.json"
         self.storage = JsonArmyStorage(filepath=self.path)
 
-    def tearDown(self) -> None:
-        self.tmpdir.cleanup()
-
     def test_save_and_load_roundtrip(self) -> None:
-        roster = {"Osito": 3, "Principe": 2, "Invalido": 0}
-        self.storage.save(Alignment.BENEVOLENT, roster)
+        self.storage.save(Alignment.BENEVOLENT, dict(_ROSTER_IN))
         loaded = self.storage.load(Alignment.BENEVOLENT)
-        self.assertEqual({"Osito": 3, "Principe": 2}, loaded)
+        self.assertEqual(_ROSTER_EXPECTED, loaded)
 
     def test_load_handles_missing_and_invalid_files(self) -> None:
         # Missing file returns empty dict.
@@ -31,9 +50,18 @@ class JsonArmyStorageTestCase(unittest.TestCase):
         self.assertEqual({}, self.storage.load(Alignment.MALEVOLENT))
 
     def test_save_creates_parent_directory(self) -> None:
-        nested_path = Path(self.tmpdir.name) / "nested" / "armies.json"
+        nested_path = self.workdir / "nested" / "armies.json"
         storage = JsonArmyStorage(filepath=nested_path)
         storage.save(Alignment.MALEVOLENT, {"Hoggin": 1})
         self.assertTrue(nested_path.exists())
-        data = json.loads(nested_path.read_text(encoding="utf-8"))
+        data = json.loads(nested_path.read_bytes())
         self.assertIn("MALEVOLENT", data)
+
+    def test_save_replaces_file_and_reuses_loaded_data(self) -> None:
+        self.storage.save(Alignment.BENEVOLENT, {"Osito": 1})
+        self.storage.save(Alignment.MALEVOLENT, {"Hoggin": 2})
+        self.assertEqual([self.path], list(self.path.parent.iterdir()))
+
+        reopened = JsonArmyStorage(filepath=self.path)
+        self.assertEqual({"Osito": 1}, reopened.load(Alignment.BENEVOLENT))
+        self.assertEqual({"Hoggin": 2}, reopened.load(Alignment.MALEVOLENT))
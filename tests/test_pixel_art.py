@@ -0,0 +1,46 @@
+import unittest
+
+from app.ui.pixel_art import SPRITES, PixelSprite, get_sprite, render_sprite, sprite_names
+
+
+class RecordingCanvas:
+    def __init__(self) -> None:
+        self.rectangles = []
+
+    def create_rectangle(self, *coords, **options) -> None:
+        self.rectangles.append((coords, options["fill"]))
+
+
+class PixelArtTestCase(unittest.TestCase):
+    def test_draw_ops_skip_background_and_unknown_codes(self) -> None:
+        sprite = PixelSprite(palette={"X": "#111", "E": "#222"}, rows=(".X?", "EX."))
+        self.assertEqual(((1, 0, "#111"), (0, 1, "#222"), (1, 1, "#111")), sprite.draw_ops)
+        self.assertEqual((3, 2), (sprite.width, sprite.height))
+
+    def test_rects_merge_runs_and_stacked_rows(self) -> None:
+        sprite = PixelSprite(palette={"X": "#111", "E": "#222"}, rows=("XXE", "XXE", ".X."))
+        self.assertEqual(
+            ((0, 0, 2, 2, "#111"), (2, 0, 1, 2, "#222"), (1, 2, 1, 1, "#111")),
+            sprite.rects,
+        )
+
+    def test_render_sprite_covers_every_visible_cell(self) -> None:
+        sprite = get_sprite("Osito", "#ffffff")
+        canvas = RecordingCanvas()
+        render_sprite(canvas, sprite, 10, 20, pixel_size=4)
+
+        visible = sum(code != "." for row in sprite.rows for code in row)
+        area = sum((x1 - x0) * (y1 - y0) for (x0, y0, x1, y1), _ in canvas.rectangles)
+        self.assertEqual(visible * 16, area)
+        self.assertLess(len(canvas.rectangles), visible)
+        self.assertEqual(((18, 20, 30, 24), "#fddde4"), canvas.rectangles[0])
+
+    def test_unknown_race_uses_default_color_block(self) -> None:
+        sprite = get_sprite("desconocido", "#abcdef")
+        self.assertEqual(16, len(sprite.draw_ops))
+        self.assertEqual({"#abcdef"}, {color for _, _, color in sprite.draw_ops})
+
+    def test_fallback_sprite_is_reused_per_color(self) -> None:
+        self.assertIs(get_sprite("desconocido", "#abcdef"), get_sprite("desconocido", "#abcdef"))
+        self.assertIsNot(get_sprite("desconocido", "#abcdef"), get_sprite("desconocido", "#123456"))
+        self.assertEqual(tuple(SPRITES), tuple(sprite_names()))
@@ -1,24 +1,31 @@
 import unittest
 
 from app.domain.alignment import Alignment
+from app.domain.race import BENEVOLENT_RACES
 from app.services.race_catalog import RaceCatalog
 
 
 class RaceCatalogTestCase(unittest.TestCase):
-    def setUp(self) -> None:
-        self.catalog = RaceCatalog()
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.catalog = RaceCatalog()
+        cls.good_names = frozenset(cls.catalog.names_for(Alignment.BENEVOLENT))
+        cls.evil_names = frozenset(cls.catalog.names_for(Alignment.MALEVOLENT))
 
     def test_names_exist_for_both_alignments(self) -> None:
-        good_names = list(self.catalog.names_for(Alignment.BENEVOLENT))
-        evil_names = list(self.catalog.names_for(Alignment.MALEVOLENT))
-        self.assertGreater(len(good_names), 0)
-        self.assertGreater(len(evil_names), 0)
-        self.assertNotEqual(set(good_names), set(evil_names))
+        self.assertGreater(len(self.good_names), 0)
+        self.assertGreater(len(self.evil_names), 0)
+        self.assertNotEqual(self.good_names, self.evil_names)
 
     def test_lookup_is_case_insensitive(self) -> None:
         race = self.catalog.find_by_name("osito")
         self.assertIsNotNone(race)
         self.assertEqual("Osito", race.name)
 
+    def test_lookup_returns_canonical_instance(self) -> None:
+        osito = BENEVOLENT_RACES[0]
+        self.assertIs(osito, self.catalog.find_by_name("Osito"))
+        self.assertIs(osito, self.catalog.find_by_name(" OSITO "))
+
     def test_lookup_unknown_returns_none(self) -> None:
         self.assertIsNone(self.catalog.find_by_name("desconocido"))